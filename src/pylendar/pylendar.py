@@ -3,9 +3,7 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
-#     "python-dateutil",
 #     "astronomy-engine",
-#     "lunardate",
 # ]
 # ///
 
@@ -17,35 +15,26 @@ for today and upcoming days. See the manpage for full documentation.
 
 import argparse
 import calendar
-import contextlib
 import datetime
 import functools
 import locale
 import logging
+import operator
 import os
 import re
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, TypeAlias, final
 
-try:
-    import dateutil.easter
-except ImportError:  # pragma: no cover
-    sys.exit("Error: This script requires the 'python-dateutil' package.")
-
 try:
     import astronomy
 except ImportError:  # pragma: no cover
     sys.exit("Error: This script requires the 'astronomy-engine' package.")
 
-try:
-    from lunardate import LunarDate
-except ImportError:  # pragma: no cover
-    sys.exit("Error: This script requires the 'lunardate' package.")
-
 STARTER_CALENDAR = """\
 /* pylendar starter calendar. See `man pylendar` for the full date format
  * reference. Lines below are TAB-separated: <date><TAB><description>. */
@@ -94,12 +83,35 @@ _NAME = rf"{_LETTER}+\.?"  # month/weekday name; some locales abbreviate with a
 _NN = r"\d{1,2}"  # 1-or-2-digit number (month or day)
 _DELTA = r"\d{1,3}"  # max ±999 days; 4+ digits look like a year
 
-DateSet: TypeAlias = set[datetime.date]
+# Date patterns that do not depend on locale or directives, compiled once
+_SPECIAL_OFFSET_RE = re.compile(rf"({_LETTER}+)([+-])({_DELTA})")
+_FULL_DATE_RE = re.compile(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})")
+_SLASH_DD_RE = re.compile(rf"({_NN}|{_NAME})/({_NN})")
+_MM_WKDAY_OFFSET_RE = re.compile(rf"({_NN})/({_NAME})([+-])({_DELTA})")
+_MONTH_WKDAY_OFFSET_RE = re.compile(rf"({_NAME})\s+({_NAME})([+-])({_DELTA})")
+_MONTH_DAY_1_RE = re.compile(rf"({_NAME})\s+({_NN})")
+_MONTH_DAY_2_RE = re.compile(rf"({_NN})\s+({_NAME})")
+# All the day wildcards in one alternation: **, * DD, DD *, * Fri+3
+_WILDCARD_RE = re.compile(
+    rf"\*\s*(?P<every>\*)|\*\s*(?P<day>{_NN})|(?P<day_first>{_NN})\s+\*"
+    rf"|\*\s+(?P<wkday>{_NAME})(?P<sign>[+-])(?P<delta>{_DELTA})"
+)
+_MONTH_WILDCARD_RE = re.compile(rf"({_NAME})\s*\*")
+# Anchor offset capped at 3 digits so 4-digit tails (e.g. Sun<Dec 25-2015)
+# aren't misparsed as anchor "Dec 25" with a -2015-day offset.
+_WKDAY_REL_RE = re.compile(
+    rf"(?P<wkday>{_NAME})\s*(?P<dir>[<>])\s*(?P<anchor>.+?)(?P<offset>[+-]{_DELTA})?"
+)
+_AGE_RE = re.compile(r"\[(\d{4})\]")
+
+DateSet: TypeAlias = AbstractSet[datetime.date]  # resolvers may share frozensets
 
 
 class DateExpr(ABC):
     """A date expression that resolves to concrete dates for a given year."""
 
+    __slots__ = ()
+
     variable: ClassVar[bool] = True
     """Whether the resolved date changes from year to year.
 
@@ -119,10 +131,16 @@ class DateExpr(ABC):
         that can cross a year boundary (see ``OffsetDate`` and
         ``WeekdayRelativeToDate``) override this.
         """
-        return date in self.resolve(date.year)
+        return date in _resolve_cached(self, date.year)
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=4096)
+def _resolve_cached(expr: DateExpr, year: int) -> frozenset[datetime.date]:
+    """Resolve an expression once per year; equal expressions share an entry."""
+    return frozenset(expr.resolve(year))
+
+
+@dataclass(frozen=True, slots=True)
 class FixedDate(DateExpr):
     """A fixed month/day, optionally pinned to a specific year."""
 
@@ -141,7 +159,7 @@ class FixedDate(DateExpr):
             return set()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WildcardDay(DateExpr):
     """Matches the given day in every month (e.g., * 15)."""
 
@@ -151,14 +169,14 @@ class WildcardDay(DateExpr):
 
     def resolve(self, year: int) -> DateSet:
         """Return dates for this day in all 12 months of the given year."""
-        dates: DateSet = set()
-        for month in range(1, 13):
-            with contextlib.suppress(ValueError):
-                dates.add(datetime.date(year, month, self.day))
-        return dates
+        return {
+            datetime.date(year, month, self.day)
+            for month in range(1, 13)
+            if 1 <= self.day <= calendar.monthrange(year, month)[1]
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EveryDay(DateExpr):
     """Matches every day of the year (e.g., **)."""
 
@@ -171,7 +189,7 @@ class EveryDay(DateExpr):
         return {jan1 + datetime.timedelta(days=d) for d in range(num_days)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EveryDayOfMonth(DateExpr):
     """Matches every day of a specific month (e.g., June*)."""
 
@@ -185,7 +203,7 @@ class EveryDayOfMonth(DateExpr):
         return {datetime.date(year, self.month, d) for d in range(1, num_days + 1)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuiltinSpecial(DateExpr):
     """A built-in special date (Easter, seasons, moon phases, etc.).
 
@@ -199,7 +217,7 @@ class BuiltinSpecial(DateExpr):
 
     def resolve(self, year: int) -> DateSet:
         """Return the dates of this special date in the given year."""
-        return set(_builtin_special_dates(year, self.utc_offset_hours)[self.name])
+        return _builtin_special_date(self.name, year, self.utc_offset_hours)
 
 
 def _find_nth_weekday(
@@ -211,21 +229,17 @@ def _find_nth_weekday(
     n < 0: count from end (-1=last, -2=second-to-last)
     Returns None if the occurrence doesn't exist (e.g. 5th Monday of Feb).
     """
+    first_weekday, num_days = calendar.monthrange(year, month)
+    first = (weekday - first_weekday) % 7 + 1  # Day of first occurrence
     if n > 0:
-        first_day = datetime.date(year, month, 1)
-        days_ahead = (weekday - first_day.weekday()) % 7
-        first_occurrence = first_day + datetime.timedelta(days=days_ahead)
-        target = first_occurrence + datetime.timedelta(weeks=n - 1)
+        day = first + 7 * (n - 1)
     else:
-        last_day_num = calendar.monthrange(year, month)[1]
-        last_day = datetime.date(year, month, last_day_num)
-        days_back = (last_day.weekday() - weekday) % 7
-        last_occurrence = last_day - datetime.timedelta(days=days_back)
-        target = last_occurrence + datetime.timedelta(weeks=n + 1)
-    return target if target.month == month else None
+        last = first + 7 * ((num_days - first) // 7)
+        day = last + 7 * (n + 1)
+    return datetime.date(year, month, day) if 1 <= day <= num_days else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NthWeekdayOfMonth(DateExpr):
     """Nth weekday of a specific month (e.g., May Sun+2 for Mother's Day)."""
 
@@ -239,7 +253,7 @@ class NthWeekdayOfMonth(DateExpr):
         return {result} if result else set()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NthWeekdayEveryMonth(DateExpr):
     """Nth weekday of every month (e.g., * Fri+3 for 3rd Friday of every month)."""
 
@@ -255,7 +269,7 @@ class NthWeekdayEveryMonth(DateExpr):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OffsetDate(DateExpr):
     """A computed date offset by a number of days (e.g., Easter-2 for Good Friday)."""
 
@@ -272,7 +286,7 @@ class OffsetDate(DateExpr):
         return self.base.matches(date - datetime.timedelta(days=self.offset))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EveryWeekday(DateExpr):
     """Every occurrence of a weekday in the year (e.g., Friday)."""
 
@@ -281,12 +295,12 @@ class EveryWeekday(DateExpr):
     def resolve(self, year: int) -> DateSet:
         """Return all occurrences of this weekday in the given year."""
         jan1 = datetime.date(year, 1, 1)
-        first = jan1 + datetime.timedelta(days=(self.weekday - jan1.weekday()) % 7)
-        week = datetime.timedelta(weeks=1)
-        return {day for w in range(53) if (day := first + week * w).year == year}
+        first = jan1.toordinal() + (self.weekday - jan1.weekday()) % 7
+        last = datetime.date(year, 12, 31).toordinal()
+        return set(map(datetime.date.fromordinal, range(first, last + 1, 7)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeekdayRelativeToDate(DateExpr):
     """Weekday strictly before or after a fixed date (e.g., Sat>Jun 19)."""
 
@@ -386,10 +400,6 @@ def cli(argv: list[str] | None = None) -> None:
         run_init()
         return
 
-    calendar_path = resolve_calendar_path(args.file)
-    if calendar_path is None:
-        return
-
     friday = bsd_to_python_weekday(args.F)
     opts = CalendarOptions(
         ahead=args.W if args.W is not None else args.A,
@@ -401,8 +411,8 @@ def cli(argv: list[str] | None = None) -> None:
         include_dirs=DEFAULT_CALENDAR_PATHS,
     )
     try:
-        lines = process_calendar(calendar_path, today, opts)
-    except (OSError, SyntaxError) as e:
+        lines = _process_calendar_arg(args.file, today, opts)
+    except (OSError, SyntaxError, UnicodeDecodeError) as e:
         sys.exit(f"Error: Could not read calendar file: {e}")
 
     for line in lines:
@@ -438,7 +448,18 @@ def process_calendar(
     """Process a calendar file and return formatted event strings."""
     opts = options or CalendarOptions()
     processor = SimpleCPP(include_dirs=opts.include_dirs)
-    calendar_lines = join_continuation_lines(processor.process_file(calendar_path))
+    return process_calendar_lines(processor.process_file(calendar_path), today, opts)
+
+
+def process_calendar_lines(
+    calendar_lines: list[str],
+    today: datetime.date,
+    options: CalendarOptions | None = None,
+) -> list[str]:
+    """Return formatted event strings for already preprocessed calendar lines."""
+    opts = options or CalendarOptions()
+    lines = join_continuation_lines(calendar_lines)
+    event_lines, setting_lines = split_event_lines(lines)
 
     ahead_days = (
         opts.ahead
@@ -456,9 +477,9 @@ def process_calendar(
         expand_weekends=opts.expand_weekends,
     )
     date_exprs = parse_special_dates(
-        calendar_lines, utc_offset_hours=opts.utc_offset_hours
+        setting_lines, utc_offset_hours=opts.utc_offset_hours
     )
-    directives = extract_directives(calendar_lines)
+    directives = extract_directives(setting_lines)
     date_parser = DateStringParser(date_exprs, directives=directives)
 
     log.info(f"Today: {today}")
@@ -466,27 +487,53 @@ def process_calendar(
     log.debug(f"dates_to_check = {dates_to_check}")
     log.debug(f"date_exprs = {date_exprs}")
 
+    memo: dict[str, tuple[frozenset[datetime.date], bool]] = {}
     matching_events = [
         event
-        for line in calendar_lines
-        for event in get_matching_events(line, dates_to_check, date_parser)
+        for line in event_lines
+        for event in get_matching_events(line, dates_to_check, date_parser, memo)
     ]
     log.info(f"Found {len(matching_events)} event(s) in date range")
-    return [
-        format_event(event, weekday=opts.weekday) for event in sorted(matching_events)
-    ]
+    # Stable sort on the date: same-day events keep their calendar order
+    matching_events.sort(key=operator.attrgetter("date"))
+    return [format_event(event, weekday=opts.weekday) for event in matching_events]
+
+
+def _process_calendar_arg(
+    file_arg: str | None, today: datetime.date, opts: CalendarOptions
+) -> list[str]:
+    """Process the calendar chosen by -f (``-`` is standard input) or found."""
+    if file_arg == "-":
+        processor = SimpleCPP(include_dirs=opts.include_dirs)
+        # Calendar files are UTF-8 whatever the locale, so stdin is too
+        text = sys.stdin.buffer.read().decode("utf-8")
+        source = processor.process_text(text, Path("<stdin>"))
+        return process_calendar_lines(source, today, opts)
+    calendar_path = resolve_calendar_path(file_arg)
+    if calendar_path is None:
+        return []
+    return process_calendar(calendar_path, today, opts)
+
+
+def split_event_lines(lines: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Split lines into (event lines, setting lines): only events have a tab."""
+    event_lines: list[str] = []
+    setting_lines: list[str] = []
+    for line in lines:
+        (event_lines if "\t" in line else setting_lines).append(line)
+    return event_lines, setting_lines
 
 
 def join_continuation_lines(lines: list[str]) -> list[str]:
     """Join tab-indented continuation lines with their parent line."""
-    result: list[str] = []
+    result: list[list[str]] = []
     for line in lines:
         if line.startswith("\t") and result:
-            # Continuation line - append to previous
-            result[-1] += "\n" + line
+            # Continuation line - append to previous, joined once at the end
+            result[-1].append(line)
         else:
-            result.append(line)
-    return result
+            result.append([line])
+    return ["\n".join(parts) for parts in result]
 
 
 @dataclass
@@ -530,6 +577,23 @@ def _parse_signed_int(match: re.Match[str], sign_group: int, value_group: int) -
     return sign * int(match.group(value_group))
 
 
+_NameMaps: TypeAlias = tuple[dict[str, int], dict[str, int]]
+
+
+@functools.cache
+def _environment_lc_time() -> str:
+    """Return the LC_TIME name ``setlocale(LC_TIME, "")`` picks, then restore it."""
+    with calendar.different_locale(("", None)):
+        return locale.setlocale(locale.LC_TIME)
+
+
+@functools.lru_cache(maxsize=16)
+def _locale_maps(loc: tuple[str | None, str | None]) -> _NameMaps:
+    """Return a locale's (month map, weekday map), for callers to copy."""
+    with calendar.different_locale(loc):
+        return DateStringParser.build_month_map(), DateStringParser.build_weekday_map()
+
+
 @final
 class DateStringParser:  # pylint: disable=too-many-instance-attributes
     """Parser for date strings from calendar files.
@@ -553,29 +617,19 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
         # Start with the current locale's names (in case an embedding
         # application has called locale.setlocale itself)
-        self.month_map = self.build_month_map()
-        self.weekday_map = self.build_weekday_map()
+        months, weekdays = _locale_maps((locale.setlocale(locale.LC_TIME), None))
+        self.month_map = dict(months)
+        self.weekday_map = dict(weekdays)
 
         # Layer the user's environment locale on top, mirroring BSD
         # calendar's setlocale(LC_ALL, "") at startup
-        saved_lc_time = locale.setlocale(locale.LC_TIME)
         try:
-            locale.setlocale(locale.LC_TIME, "")
-            self._layer_locale_maps()
+            self._layer_locale_maps(_locale_maps((_environment_lc_time(), None)))
         except locale.Error:
             log.debug("Environment locale not available; skipping")
-        finally:
-            locale.setlocale(locale.LC_TIME, saved_lc_time)
 
-        # Layer C/English names on top ("C.UTF-8" is not a valid locale
-        # on Windows, so fall back to plain "C"; English names are ASCII)
-        for c_locale in (("C", "UTF-8"), ("C", None)):
-            try:
-                with calendar.different_locale(c_locale):
-                    self._layer_locale_maps()
-            except locale.Error:
-                continue
-            break
+        # Layer C/English names on top
+        self._layer_locale_maps(_locale_maps(("C", None)))
 
         # Layer LANG= locale names on top, if set
         lang_base = dirs.lang.lower().split(".")[0] if dirs.lang else None
@@ -584,8 +638,7 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
                 lang_parts = dirs.lang.split(".", 1) if dirs.lang else []
                 encoding = lang_parts[1] if len(lang_parts) > 1 else "UTF-8"
                 lang_locale = (lang_parts[0], encoding)
-                with calendar.different_locale(lang_locale):
-                    self._layer_locale_maps()
+                self._layer_locale_maps(_locale_maps(lang_locale))
                 log.info(f"Using locale: {dirs.lang}")
             except locale.Error:
                 log.warning(f"LANG={dirs.lang}: locale not available; ignoring")
@@ -596,23 +649,11 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
             for word, n in zip(dirs.sequence, (1, 2, 3, 4, 5, -1), strict=True):
                 self.ordinal_map[word.casefold()] = n
             log.info(f"Custom ordinal sequence: {dirs.sequence}")
-        ordinals_re = "|".join(map(re.escape, self.ordinal_map))
-
-        # Precompile regexes used in parsing
-        self._re_special_offset = re.compile(rf"({_LETTER}+)([+-])({_DELTA})")
-        self._re_full_date = re.compile(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})")
-        self._re_slash_dd = re.compile(rf"({_NN}|{_NAME})/({_NN})")
-        self._re_mm_wkday_offset = re.compile(rf"({_NN})/({_NAME})([+-])({_DELTA})")
-        self._re_month_wkday_offset = re.compile(
-            rf"({_NAME})\s+({_NAME})([+-])({_DELTA})"
-        )
-        self._re_month_day_1 = re.compile(rf"({_NAME})\s+({_NN})")
-        self._re_month_day_2 = re.compile(rf"({_NN})\s+({_NAME})")
-        self._re_wildcard_wkday = re.compile(rf"\*\s+({_NAME})([+-])({_DELTA})")
-        self._re_wildcard_day = re.compile(r"\*\s*(\d{1,2})|(\d{1,2})\s+\*")
-        self._re_month_wildcard = re.compile(rf"({_NAME})\s*\*")
 
-        name, ords = _NAME, ordinals_re
+        self._parse_cache: dict[str, DateExpr | None] = {}
+
+        # Only the ordinal patterns depend on the instance (via SEQUENCE=)
+        name, ords = _NAME, "|".join(map(re.escape, self.ordinal_map))
         self._re_mm_ord = re.compile(rf"({_NN})/({name})({ords})([+-]{_DELTA})?")
         self._re_month_ord_1 = re.compile(rf"({name})/({name})({ords})([+-]{_DELTA})?")
         self._re_month_ord_2 = re.compile(rf"({name})({ords})\s+({name})")
@@ -636,22 +677,28 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
             for n, d in enumerate(s)
         }
 
-    def _layer_locale_maps(self) -> None:
-        """Update month/weekday maps from the currently active locale."""
-        self.month_map.update(self.build_month_map())
-        self.weekday_map.update(self.build_weekday_map())
+    def _layer_locale_maps(self, maps: _NameMaps) -> None:
+        """Update month/weekday maps from a locale's (month, weekday) maps."""
+        months, weekdays = maps
+        self.month_map.update(months)
+        self.weekday_map.update(weekdays)
 
     def parse(self, date_str: str) -> DateExpr | None:
         """Parse a date string from the calendar file.
 
-        Supports special dates, aliases, and standard date formats.
-        Pattern order matters — more specific patterns are tried first.
+        Supports special dates, aliases, and standard date formats. Results
+        are cached per normalized string, since calendar files repeat dates.
         """
-        date_str = date_str.strip().casefold()
+        key = date_str.strip().casefold()
+        if key not in self._parse_cache:
+            self._parse_cache[key] = self._parse_normalized(key)
+        return self._parse_cache[key]
 
+    def _parse_normalized(self, date_str: str) -> DateExpr | None:
+        """Parse a stripped, casefolded date string, most specific patterns first."""
         # Special date with offset (e.g., Easter-2, FullMoon+1)
         # Must precede plain special-date lookup
-        if match := self._re_special_offset.fullmatch(date_str):
+        if match := _SPECIAL_OFFSET_RE.fullmatch(date_str):
             offset = _parse_signed_int(match, 2, 3)
             if base := self.date_exprs.get(match.group(1)):
                 return OffsetDate(base, offset)
@@ -699,7 +746,7 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
     def _parse_full_date(self, date_str: str) -> DateExpr | None:
         """Parse YYYY/M/D or YYYY-MM-DD format (e.g., 2026/2/17, 2026-02-17)."""
-        if match := self._re_full_date.fullmatch(date_str):
+        if match := _FULL_DATE_RE.fullmatch(date_str):
             return FixedDate(
                 month=int(match.group(2)),
                 day=int(match.group(3)),
@@ -709,7 +756,7 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
     def _parse_slash_dd(self, date_str: str) -> DateExpr | None:
         """Parse MM/DD or Month/DD format (e.g., 07/21, apr/17)."""
-        if match := self._re_slash_dd.fullmatch(date_str):
+        if match := _SLASH_DD_RE.fullmatch(date_str):
             g1 = match.group(1)
             month = int(g1) if g1.isdigit() else self.month_map.get(g1)
             if month is not None:
@@ -718,7 +765,7 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
     def _parse_mm_wkday_offset(self, date_str: str) -> DateExpr | None:
         """Parse MM/Weekday+/-N format (e.g., 03/Sun-1, 11/Wed+3, 12/Sun+1)."""
-        if match := self._re_mm_wkday_offset.fullmatch(date_str):
+        if match := _MM_WKDAY_OFFSET_RE.fullmatch(date_str):
             month = int(match.group(1))
             wkday_name = match.group(2)
             if wkday_name in self.weekday_map:
@@ -728,7 +775,7 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
     def _parse_month_wkday_offset(self, date_str: str) -> DateExpr | None:
         """Parse Month Weekday+/-N format (e.g., May Sun+2, Nov Thu+4, May Mon-1)."""
-        if match := self._re_month_wkday_offset.fullmatch(date_str):
+        if match := _MONTH_WKDAY_OFFSET_RE.fullmatch(date_str):
             month_name, wkday_name = match.group(1), match.group(2)
             n = _parse_signed_int(match, 3, 4)
             if month_name in self.month_map and wkday_name in self.weekday_map:
@@ -741,9 +788,9 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
 
     def _parse_month_day(self, date_str: str) -> DateExpr | None:
         """Parse Month DD or DD Month format (e.g., July 9, 01 Jan)."""
-        if match := self._re_month_day_1.fullmatch(date_str):
+        if match := _MONTH_DAY_1_RE.fullmatch(date_str):
             month_name, day = match.group(1), int(match.group(2))
-        elif match := self._re_month_day_2.fullmatch(date_str):
+        elif match := _MONTH_DAY_2_RE.fullmatch(date_str):
             month_name, day = match.group(2), int(match.group(1))
         else:
             return None
@@ -751,24 +798,21 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
             return FixedDate(self.month_map[month_name], day)
         return None
 
-    def _parse_wildcard_wkday(self, date_str: str) -> DateExpr | None:
-        """Parse * Weekday+/-N format (e.g., * Fri+3)."""
-        if match := self._re_wildcard_wkday.fullmatch(date_str):
-            wkday_name = match.group(1)
-            n = _parse_signed_int(match, 2, 3)
-            if wkday_name in self.weekday_map:
-                return NthWeekdayEveryMonth(self.weekday_map[wkday_name], n)
-        return None
-
-    def _parse_wildcard_day(self, date_str: str) -> DateExpr | None:
-        """Parse * DD, *DD, or DD * format (e.g., * 9, *15, 15 *)."""
-        if match := self._re_wildcard_day.fullmatch(date_str):
-            return WildcardDay(int(match.group(1) or match.group(2)))
+    def _parse_wildcard(self, date_str: str) -> DateExpr | None:
+        """Parse **, * DD, *DD, DD *, or * Weekday+/-N (e.g., * 9, 15 *, * Fri+3)."""
+        if not (match := _WILDCARD_RE.fullmatch(date_str)):
+            return None
+        if match["every"]:
+            return EveryDay()
+        if day := match["day"] or match["day_first"]:
+            return WildcardDay(int(day))
+        if (wkday := self.weekday_map.get(match["wkday"])) is not None:
+            return NthWeekdayEveryMonth(wkday, _parse_signed_int(match, 5, 6))
         return None
 
     def _parse_month_wildcard(self, date_str: str) -> DateExpr | None:
         """Parse Month* or Month * format (every day of that month, e.g., June*)."""
-        if match := self._re_month_wildcard.fullmatch(date_str):
+        if match := _MONTH_WILDCARD_RE.fullmatch(date_str):
             month_name = match.group(1)
             if month_name in self.month_map:
                 return EveryDayOfMonth(self.month_map[month_name])
@@ -788,16 +832,9 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
                 )
         return None
 
-    # Anchor offset capped at 3 digits so 4-digit tails (e.g. Sun<Dec 25-2015)
-    # aren't misparsed as anchor "Dec 25" with a -2015-day offset.
-    _WKDAY_REL_RE: ClassVar[re.Pattern[str]] = re.compile(
-        rf"(?P<wkday>{_NAME})\s*(?P<dir>[<>])\s*"
-        rf"(?P<anchor>.+?)(?P<offset>[+-]{_DELTA})?"
-    )
-
     def _parse_weekday_relative(self, date_str: str) -> DateExpr | None:
         """Parse Wkday<Date or Wkday>Date format (e.g., Sat>Jun 19, Sun<Dec 25-7)."""
-        match = self._WKDAY_REL_RE.fullmatch(date_str)
+        match = _WKDAY_REL_RE.fullmatch(date_str)
         if not match:
             return None
 
@@ -824,13 +861,15 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
             anchor_offset=anchor_offset,
         )
 
-    _EVERY_DAY_RE: ClassVar[re.Pattern[str]] = re.compile(r"\*\s*\*")
-
     def _parse_format_patterns(self, date_str: str) -> DateExpr | None:
         """Parse regex-based date format patterns."""
         # YYYY/M/D, YYYY-MM-DD, MM/Wkday+N, MM/WkdayOrd, Month/WkdayOrd,
         # Month/DD, or MM/DD
-        if "/" in date_str or ("-" in date_str and date_str[0].isdigit()):
+        if "/" in date_str or ("-" in date_str and date_str[:1].isdigit()):
+            month, _, day = date_str.partition("/")
+            short = max(len(month), len(day)) <= 2  # noqa: PLR2004
+            if short and month.isdecimal() and day.isdecimal():
+                return FixedDate(int(month), int(day))
             return (
                 self._parse_full_date(date_str)
                 or self._parse_mm_wkday_offset(date_str)
@@ -838,71 +877,104 @@ class DateStringParser:  # pylint: disable=too-many-instance-attributes
                 or self._parse_slash_dd(date_str)
             )
 
-        # Non-slash patterns, tried most-specific first
+        # Non-slash patterns, tried most-specific first.  The first character
+        # already rules out most of them, so only try the plausible group.
+        first = date_str[:1]
+        if first == "*":
+            return self._parse_wildcard(date_str)
+        if first.isdecimal():
+            return self._parse_month_day(date_str) or self._parse_wildcard(date_str)
         return (
             self._parse_month_wkday_offset(date_str)
             or self._parse_month_day(date_str)
             or self._parse_month_wildcard(date_str)
-            or (EveryDay() if self._EVERY_DAY_RE.fullmatch(date_str) else None)
-            or self._parse_wildcard_wkday(date_str)
-            or self._parse_wildcard_day(date_str)
             or self._parse_wkday_ord_month(date_str)
         )
 
 
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+# "//" must follow whitespace so URLs survive; a leading one is cut separately,
+# since an "^|" alternative would stop the regex engine skipping ahead to "//"
+_LINE_COMMENT_RE = re.compile(r"\s//.*")
+
+
 def remove_comments(code: str) -> str:
     """Remove C-style block and line comments (does not handle nesting or strings)."""
-    code = re.sub(r"/\*.*?\*/", "", code, flags=re.DOTALL)  # Remove block comments
-    return re.sub(r"(?:^|\s)//.*", "", code)  # Remove line comments
+    code = _BLOCK_COMMENT_RE.sub("", code)
+    if code.startswith("//"):
+        newline = code.find("\n")
+        code = code[newline:] if newline >= 0 else ""
+    return _LINE_COMMENT_RE.sub("", code)
 
 
 class SimpleCPP:
     """A simple C/C++ preprocessor emulator."""
 
+    _INCLUDE_RE: ClassVar[re.Pattern[str]] = re.compile(r'#include\s+[<"]([^">]+)[">]')
+
     def __init__(self, include_dirs: Sequence[Path | str]) -> None:
         """Initialize the preprocessor with include directories."""
         self.include_dirs: list[Path] = [Path(d) for d in include_dirs]
         self.included_files: set[Path] = set()
+        self._include_cache: dict[tuple[Path, Path], Path | None] = {}
 
     def process_file(self, path: Path) -> list[str]:
         """Process a C/C++ source file, resolving includes and removing comments."""
-        abs_path = path.resolve()
+        lines: list[str] = []
+        self._process_into(path.resolve(), lines)
+        return lines
+
+    def process_text(self, text: str, origin: Path | None = None) -> list[str]:
+        """Process in-memory source; includes resolve from *origin*'s directory."""
+        abs_path = (origin or Path("<string>")).resolve()
+        self.included_files.add(abs_path)
+        lines: list[str] = []
+        self._process_text(text, abs_path, lines)
+        return lines
+
+    def _process_into(self, abs_path: Path, lines: list[str]) -> None:
+        """Append the lines of an already resolved *abs_path* and its includes."""
         if abs_path in self.included_files:
             log.info(f"Skipping (already included): {_display_path(abs_path)}")
-            return []
+            return
         log.info(f"Processing: {_display_path(abs_path)}")
         self.included_files.add(abs_path)
 
-        lines: list[str] = []
         try:
-            text = path.read_text(encoding="utf-8")
+            text = abs_path.read_text(encoding="utf-8")
         except UnicodeDecodeError:
-            log.warning(f"Skipping {path.name}: not valid UTF-8")
-            return []
+            log.warning(f"Skipping {abs_path.name}: not valid UTF-8")
+            return
+        self._process_text(text, abs_path, lines)
+
+    def _process_text(self, text: str, abs_path: Path, lines: list[str]) -> None:
+        """Strip comments from one file's text, then resolve its directives."""
+        if "#" not in text and "/*" not in text and "//" not in text:
+            lines.extend(text.splitlines())  # no directives or comments to handle
+            return
         for line_num, line in enumerate(remove_comments(text).splitlines(), start=1):
             stripped = line.strip()
 
-            if stripped.startswith("#include"):
-                if match := re.match(r'#include\s+[<"]([^">]+)[">]', stripped):
-                    include_target = Path(match.group(1))
-                    include_file = self.resolve_include(include_target, abs_path.parent)
-                    if include_file:
-                        lines.extend(self.process_file(include_file))
+            if stripped[:1] != "#":
+                lines.append(line)
+            elif stripped.startswith("#include"):
+                if match := self._INCLUDE_RE.match(stripped):
+                    # Calendar bundles include the same names from many files
+                    key = (Path(match.group(1)), abs_path.parent)
+                    if key not in self._include_cache:
+                        self._include_cache[key] = self.resolve_include(*key)
+                    if include_file := self._include_cache[key]:
+                        self._process_into(include_file, lines)
                     else:
-                        msg = f"Included file not found: {include_target}"
-                        log.warning(msg)
+                        log.warning(f"Included file not found: {key[0]}")
                 else:
                     msg = (
                         f"Malformed include directive in {_display_path(abs_path)}"
                         f":{line_num}: {line}"
                     )
                     raise SyntaxError(msg)
-            elif stripped.startswith("#"):
-                log.debug(f"Skipping preprocessor directive: {line}")
             else:
-                lines.append(line)
-
-        return lines
+                log.debug(f"Skipping preprocessor directive: {line}")
 
     def resolve_include(
         self, name: Path, look_first: Path | None = None
@@ -916,9 +988,10 @@ class SimpleCPP:
         """
         dirs = [look_first, *self.include_dirs] if look_first else self.include_dirs
         for base_dir in dirs:
-            candidate = base_dir / name
-            if candidate.is_file():
-                return candidate.resolve()
+            # Plain os.path calls: most candidates miss, so skip building Paths
+            joined = os.path.join(base_dir, name)  # noqa: PTH118
+            if os.path.isfile(joined):  # noqa: PTH113
+                return Path(joined).resolve()
 
         # Locale fallback: uk_UA/foo → uk_UA.KOI8-U/foo
         parts = name.parts
@@ -972,6 +1045,49 @@ def resolve_coordinates(
     return offset, offset * 15
 
 
+def _gregorian_easter(year: int) -> datetime.date:
+    """Return Western Easter Sunday (Anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (b - (b + 8) // 25 + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def _orthodox_easter(year: int) -> datetime.date:
+    """Return Orthodox Easter Sunday as a Gregorian date (Meeus Julian algorithm)."""
+    d = (19 * (year % 19) + 15) % 30
+    e = (2 * (year % 4) + 4 * (year % 7) - d + 34) % 7
+    month, day = divmod(d + e + 114, 31)
+    julian_to_gregorian = datetime.timedelta(days=year // 100 - year // 400 - 2)
+    return datetime.date(year, month, day + 1) + julian_to_gregorian
+
+
+# Days after January 21 of the first day of the Chinese year, one base-32
+# digit per year from 1900 (the range the lunar tables used to cover)
+_CNY_FIRST_YEAR = 1900
+_CNY_OFFSETS = (
+    "ati8qe4nc1k9sg5od2lbui7qf3nc2k9rg5oe3lati6pf4nc1k8"  # 1900-1949
+    "rg6od3masi7pf4nc0j9rg6pd2lash7qf4ncuj8rg6pe2kath7q"  # 1950-1999
+    "f3mb1j8sh5od2kati7qf4mb1k8rg5nd2lati7pe3mb1k9rg5oc"  # 2000-2049
+    "2lbti7pe3mc0j8rf5od2lath6pf3mc1j8rg5od3k9sh6pf4mb0"  # 2050-2099
+)
+
+
+def _chinese_new_year(year: int) -> DateSet:
+    """Return the first day of the Chinese year, or nothing outside 1900-2099."""
+    index = year - _CNY_FIRST_YEAR
+    if not 0 <= index < len(_CNY_OFFSETS):
+        return set()
+    jan21 = datetime.date(year, 1, 21)
+    return {jan21 + datetime.timedelta(days=int(_CNY_OFFSETS[index], 32))}
+
+
 def get_seasons(year: int, utc_offset_hours: float = 0) -> dict[str, datetime.date]:
     """Get the dates of equinoxes and solstices for a given year."""
     return {
@@ -979,29 +1095,30 @@ def get_seasons(year: int, utc_offset_hours: float = 0) -> dict[str, datetime.da
     }
 
 
+@functools.lru_cache(maxsize=16)
 def _search_moon_phases(
     year: int, phase_angle: int, utc_offset_hours: float
-) -> list[datetime.datetime]:
+) -> tuple[datetime.datetime, ...]:
     """Return all moon phase datetimes for a year with UTC offset applied."""
-    # Start searching from December of the previous year to catch
-    # phases that shift into the current year locally due to timezone offsets.
-    start_time = astronomy.Time.Make(year - 1, 12, 1, 0, 0, 0)
+    # Search from local midnight on Jan 1 to local midnight on the next Jan 1,
+    # so phases that the timezone offset shifts across New Year are handled.
+    local_midnight = -utc_offset_hours / 24
+    search_time = astronomy.Time.AddDays(
+        astronomy.Time.Make(year, 1, 1, 0, 0, 0), local_midnight
+    )
+    end = astronomy.Time.AddDays(
+        astronomy.Time.Make(year + 1, 1, 1, 0, 0, 0), local_midnight
+    )
     offset = datetime.timedelta(hours=utc_offset_hours)
     results: list[datetime.datetime] = []
-    search_time = start_time
     while True:
         moon_phase = astronomy.SearchMoonPhase(phase_angle, search_time, 40)
-        if moon_phase is None:
-            break
-        dt = moon_phase.Utc() + offset
-
-        if dt.date().year == year:
-            results.append(dt)
-        elif dt.date().year > year:
+        if moon_phase is None or moon_phase.ut >= end.ut:
             break
-
-        search_time = astronomy.Time.AddDays(moon_phase, 1)
-    return results
+        results.append(moon_phase.Utc() + offset)
+        # The next occurrence is a synodic month (~29.5 days) away
+        search_time = astronomy.Time.AddDays(moon_phase, 25)
+    return tuple(results)
 
 
 def get_moon_phases(year: int, utc_offset_hours: float = 0) -> dict[str, DateSet]:
@@ -1024,18 +1141,19 @@ def _format_frac(value: float) -> str:
     return f"{value:.6g}"
 
 
+@functools.lru_cache(maxsize=8)
 def _get_season_datetimes(
     year: int, utc_offset_hours: float
-) -> list[tuple[str, datetime.datetime]]:
+) -> tuple[tuple[str, datetime.datetime], ...]:
     """Return equinox/solstice (keyword, datetime) pairs with UTC offset applied."""
     seasons = astronomy.Seasons(year)
     offset = datetime.timedelta(hours=utc_offset_hours)
-    return [
+    return (
         ("marequinox", seasons.mar_equinox.Utc() + offset),
         ("sepequinox", seasons.sep_equinox.Utc() + offset),
         ("junsolstice", seasons.jun_solstice.Utc() + offset),
         ("decsolstice", seasons.dec_solstice.Utc() + offset),
-    ]
+    )
 
 
 def print_diagnostic(mode: str, year: int, utc_offset: float, longitude: float) -> None:
@@ -1076,34 +1194,28 @@ _SPECIAL_NAMES: tuple[str, ...] = (
     "newmoon",
     "fullmoon",
 )
-"""Keywords of the built-in special dates computed by ``_builtin_special_dates``."""
-
-
-@functools.lru_cache
-def _builtin_special_dates(
-    year: int, utc_offset_hours: float = 0
-) -> dict[str, frozenset[datetime.date]]:
-    """Compute the built-in special dates (Easter, seasons, moon phases, etc.).
-
-    Cached so that repeated per-year lookups from ``BuiltinSpecial.resolve``
-    share the same computation.
-    """
-    dates: dict[str, frozenset[datetime.date]] = {
-        "easter": frozenset({dateutil.easter.easter(year)}),
-        "paskha": frozenset(
-            {dateutil.easter.easter(year, method=dateutil.easter.EASTER_ORTHODOX)}
-        ),
-        "chinesenewyear": frozenset({LunarDate(year, 1, 1).toSolarDate()}),
-    }
-    dates |= {
-        name: frozenset({date})
-        for name, date in get_seasons(year, utc_offset_hours).items()
-    }
-    dates |= {
-        name: frozenset(days)
-        for name, days in get_moon_phases(year, utc_offset_hours).items()
-    }
-    return dates
+"""Keywords of the built-in special dates computed by ``_builtin_special_date``."""
+
+
+@functools.lru_cache(maxsize=64)
+def _builtin_special_date(
+    name: str, year: int, utc_offset_hours: float = 0
+) -> frozenset[datetime.date]:
+    """Compute only the requested special date (Easter, a season, a moon phase)."""
+    match name:
+        case "easter":
+            return frozenset({_gregorian_easter(year)})
+        case "paskha":
+            return frozenset({_orthodox_easter(year)})
+        case "chinesenewyear":
+            return frozenset(_chinese_new_year(year))
+        case "newmoon" | "fullmoon":
+            angle = 0 if name == "newmoon" else 180
+            phases = _search_moon_phases(year, angle, utc_offset_hours)
+            return frozenset(dt.date() for dt in phases)
+        case _:
+            seasons = dict(_get_season_datetimes(year, utc_offset_hours))
+            return frozenset({seasons[name].date()})
 
 
 def _builtin_special_exprs(utc_offset_hours: float = 0) -> dict[str, DateExpr]:
@@ -1115,15 +1227,14 @@ def _collect_alias_pairs(calendar_lines: list[str]) -> list[tuple[str, str]]:
     """Extract (left, right) alias assignment pairs from calendar lines."""
     pairs: list[tuple[str, str]] = []
     for line in calendar_lines:
-        if "\t" in line or "=" not in line:
+        if (eq := line.find("=")) < 0 or "\t" in line:
             continue
-        left_raw, right_raw = line.split("=", 1)
-        if left_raw.strip() in {"LANG", "SEQUENCE"}:
+        left = line[:eq].strip()
+        if left in {"LANG", "SEQUENCE"}:
             continue
-        left = left_raw.strip().casefold()
-        right = right_raw.strip().casefold()
+        right = line[eq + 1 :].strip()
         if left and right:
-            pairs.append((left, right))
+            pairs.append((left.casefold(), right.casefold()))
     return pairs
 
 
@@ -1210,11 +1321,9 @@ def extract_directives(calendar_lines: list[str]) -> CalendarDirectives:
     sequence: tuple[str, ...] | None = None
 
     for line in calendar_lines:
-        if "\t" in line or "=" not in line:
+        if (eq := line.find("=")) < 0 or "\t" in line:
             continue
-        left, right = line.split("=", 1)
-        left = left.strip()
-        right = right.strip()
+        left, right = line[:eq].strip(), line[eq + 1 :].strip()
         if left == "LANG":
             lang = right or None
         elif left == "SEQUENCE":
@@ -1229,11 +1338,12 @@ def extract_directives(calendar_lines: list[str]) -> CalendarDirectives:
     return CalendarDirectives(lang=lang, sequence=sequence)
 
 
-def _parse_dot_date(t_str: str) -> datetime.date:
+def _parse_dot_date(t_str: str, today: datetime.date) -> datetime.date:
     """Parse a macOS/FreeBSD dot-separated date: dd[.mm[.year]].
 
     Single-digit day/month values are accepted (e.g. ``5.6``).
     Year is taken literally — no two-digit heuristic is applied.
+    A missing year comes from *today*.
     """
     parts = t_str.split(".")
     if len(parts) < 2 or len(parts) > 3:  # noqa: PLR2004
@@ -1242,7 +1352,7 @@ def _parse_dot_date(t_str: str) -> datetime.date:
     try:
         dd = int(parts[0])
         mm = int(parts[1])
-        year = int(parts[2]) if len(parts) == 3 else datetime.date.today().year  # noqa: PLR2004
+        year = int(parts[2]) if len(parts) == 3 else today.year  # noqa: PLR2004
     except ValueError:
         msg = f"Non-numeric value in dot-separated date: {t_str}"
         raise argparse.ArgumentTypeError(msg) from None
@@ -1253,16 +1363,17 @@ def _parse_dot_date(t_str: str) -> datetime.date:
         raise argparse.ArgumentTypeError(msg) from None
 
 
-def _parse_legacy_today(t_str: str) -> datetime.date | None:
+def _parse_legacy_today(t_str: str, today: datetime.date) -> datetime.date | None:
     """Try to parse -t as a legacy numeric or dot-separated format.
 
-    Returns the parsed date, or ``None`` if the string is not a legacy format.
+    Partial dates are completed from *today*. Returns ``None`` if the string
+    is not a legacy format.
     """
     if "." in t_str:
-        return _parse_dot_date(t_str)
+        return _parse_dot_date(t_str, today)
     # cSpell:ignore mmdd, ccyymmdd
-    if t_str.isdigit():
-        today = datetime.date.today()
+    # isdecimal, not isdigit: int() rejects digits like superscripts
+    if t_str.isdecimal():
         match len(t_str):
             case 2:  # dd
                 return datetime.date(today.year, today.month, int(t_str))
@@ -1281,7 +1392,12 @@ def _parse_legacy_today(t_str: str) -> datetime.date | None:
     return None
 
 
-def resolve_today(t_str: str | None, utc_offset_hours: float = 0) -> datetime.date:
+def resolve_today(
+    t_str: str | None,
+    utc_offset_hours: float = 0,
+    *,
+    today: datetime.date | None = None,
+) -> datetime.date:
     """Resolve the -t argument into a concrete date.
 
     Acceptable formats:
@@ -1290,21 +1406,24 @@ def resolve_today(t_str: str | None, utc_offset_hours: float = 0) -> datetime.da
       - Any pylendar date expression that resolves to exactly one date
         (including special dates like Easter that need UTC offset)
 
-    Returns ``datetime.date.today()`` when *t_str* is ``None``.
+    Partial dates are completed from *today*, which defaults to
+    ``datetime.date.today()``; *today* itself is returned when *t_str* is
+    ``None``.
 
     Raises:
         argparse.ArgumentTypeError: On invalid or ambiguous input.
 
     """
+    today = today or datetime.date.today()
     if t_str is None:
-        return datetime.date.today()
+        return today
 
     t_str = t_str.strip()
-    legacy = _parse_legacy_today(t_str)
+    legacy = _parse_legacy_today(t_str, today)
     if legacy is not None:
         return legacy
 
-    year = datetime.date.today().year
+    year = today.year
     date_exprs = _builtin_special_exprs(utc_offset_hours)
     date_expr = DateStringParser(date_exprs).parse(t_str)
     if date_expr is None:
@@ -1328,26 +1447,26 @@ def get_dates_to_check(
     *,
     friday: int = 4,
     expand_weekends: bool = False,
-) -> DateSet:
+) -> frozenset[datetime.date]:
     """Determine the set of dates to check for events, given -A and -B options."""
-    day = datetime.timedelta(days=1)
-    dates: DateSet = {today + day * d for d in range(-behind, 1)}
+    base = today.toordinal()
     if not expand_weekends:
-        dates.update(today + day * d for d in range(1, ahead + 1))
-        return dates
+        window = range(base - behind, base + ahead + 1)
+        return frozenset(map(datetime.date.fromordinal, window))
     # Business-day walk (macOS/FreeBSD -A): landing on the day after "Friday"
     # makes that step and the next free (don't decrement the counter).
-    saturday, remaining, current, skip = (friday + 1) % 7, ahead, today, False
+    # Walk ordinals too; ordinal 1 (0001-01-01) is a Monday, weekday 0.
+    saturday, remaining, current, skip = (friday + 1) % 7, ahead, base, False
     while remaining > 0:
-        current += day
-        dates.add(current)
+        current += 1
         if skip:
             skip = False
-        elif current.weekday() == saturday:
+        elif (current - 1) % 7 == saturday:
             skip = True
         else:
             remaining -= 1
-    return dates
+    window = range(base - behind, current + 1)
+    return frozenset(map(datetime.date.fromordinal, window))
 
 
 def parse_bsd_weekday(value: str) -> int:
@@ -1386,7 +1505,8 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-f",
         dest="file",
-        help="Path to the calendar file. Overrides the default search path.",
+        help="Path to the calendar file, or - for standard input. "
+        "Overrides the default search path.",
     )
     ahead_group = parser.add_mutually_exclusive_group()
     ahead_group.add_argument(
@@ -1481,40 +1601,43 @@ def bsd_to_python_weekday(bsd_wday: int) -> int:
 
 def replace_age_in_description(description: str, check_date: datetime.date) -> str:
     """Replace exactly one [YYYY] with calculated age in event description."""
-    matches = re.findall(r"\[(\d{4})\]", description)
-    if len(matches) == 1:
-        year_val = int(matches[0])
-        age = check_date.year - year_val
-        return description.replace(f"[{matches[0]}]", str(age))
-    return description
+    match = _AGE_RE.search(description)
+    if match is None or _AGE_RE.search(description, match.end()):
+        return description
+    age = check_date.year - int(match.group(1))
+    return f"{description[: match.start()]}{age}{description[match.end() :]}"
 
 
 def get_matching_events(
     line: str,
-    dates_to_check: DateSet,
+    dates_to_check: AbstractSet[datetime.date],
     parser: DateStringParser,
+    memo: dict[str, tuple[frozenset[datetime.date], bool]] | None = None,
 ) -> list[Event]:
-    """Get events from this line that match any of the target dates."""
-    if not line.strip() or "\t" not in line:
-        return []
-
-    date_str, event_description = line.split("\t", 1)
+    """Get events from this line that match any of the target dates.
 
-    expr = parser.parse(date_str)
-    explicit_variable = False
-
-    if expr is None and date_str.rstrip().endswith("*"):
-        explicit_variable = True
-        date_str = date_str.rstrip().removesuffix("*")
-        expr = parser.parse(date_str)
-
-    if expr is None:
-        log.debug(f"Unparseable date expression: {date_str!r}")
+    A ``memo`` shared across lines matches each distinct date string once.
+    """
+    date_str, tab, event_description = line.partition("\t")
+    if not tab or not date_str or date_str.isspace():
         return []
 
-    matching = {d for d in dates_to_check if expr.matches(d)}
+    if memo is not None and date_str in memo:
+        matching, variable = memo[date_str]
+    else:
+        expr = parser.parse(date_str)
+        trimmed = date_str.rstrip()
+        if explicit_variable := expr is None and trimmed.endswith("*"):
+            expr = parser.parse(trimmed[:-1])
+        if expr is None:
+            log.debug(f"Unparseable date expression: {date_str!r}")
+            matching, variable = frozenset(), False
+        else:
+            matching = frozenset(filter(expr.matches, dates_to_check))
+            variable = explicit_variable or expr.variable
+        if memo is not None:
+            memo[date_str] = matching, variable
 
-    variable = explicit_variable or expr.variable
     return [
         Event(d, replace_age_in_description(event_description, d), variable=variable)
         for d in matching
@@ -1525,12 +1648,14 @@ def find_calendar(look_in: Sequence[Path]) -> Path | None:
     """Find the calendar file in standard locations."""
     calendar_dir = os.environ.get("CALENDAR_DIR")
     first = Path(calendar_dir) if calendar_dir else Path.cwd()
-    dirs = list(dict.fromkeys([first, *look_in]))
-    log.debug(f"Searching for calendar in: {[str(d) for d in dirs]}")
+    # Dedupe by spelling rather than resolve(): each resolve() would lstat
+    # every path component, costing more than the one stat it saves
+    dirs = list(dict.fromkeys(map(os.fspath, [first, *look_in])))
+    log.debug(f"Searching for calendar in: {dirs}")
     for dir_path in dirs:
-        file = dir_path / "calendar"
-        if file.is_file():
-            return file.resolve()
+        file = os.path.join(dir_path, "calendar")  # noqa: PTH118
+        if os.path.isfile(file):  # noqa: PTH113
+            return Path(file).resolve()
     return None
 
 
@@ -1,17 +1,28 @@
 """Shared test fixtures for pylendar tests."""
 
+import functools
+
 import pytest
 
-from pylendar.pylendar import CalendarOptions, process_calendar
+from pylendar.pylendar import CalendarOptions, SimpleCPP, process_calendar_lines
+
+
+@functools.lru_cache(maxsize=128)
+def _preprocess(calendar_content):
+    """Preprocess calendar content once per distinct text, without touching disk.
+
+    Many tests share the same calendar text across parametrizations; the
+    result is a tuple so that no test can alter another's lines.
+    """
+    return tuple(SimpleCPP(include_dirs=()).process_text(calendar_content))
 
 
 @pytest.fixture
-def run_calendar(tmp_path):
+def run_calendar():
     """Fixture that processes calendar content and returns sorted event strings."""
 
     def _run(calendar_content, today, **options):
-        calendar_file = tmp_path / "calendar"
-        calendar_file.write_text(calendar_content, encoding="utf-8")
-        return process_calendar(calendar_file, today, CalendarOptions(**options))
+        lines = list(_preprocess(calendar_content))
+        return process_calendar_lines(lines, today, CalendarOptions(**options))
 
     return _run
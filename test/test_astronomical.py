@@ -3,9 +3,17 @@
 import datetime
 from itertools import pairwise
 
+import pytest
+
 from pylendar.pylendar import get_moon_phases, get_seasons
 
 
+@pytest.fixture(scope="module")
+def moon_phases_2026():
+    """Moon phases for 2026, computed once for the tests that share them."""
+    return get_moon_phases(2026)
+
+
 def test_seasons_2026():
     """Test that seasons have correct keys, order, and specific dates for 2026."""
     seasons = get_seasons(2026)
@@ -18,9 +26,9 @@ def test_seasons_2026():
     }
 
 
-def test_moon_phases_2026():
+def test_moon_phases_2026(moon_phases_2026):
     """Test moon phase counts, years, and known January 2026 dates."""
-    moon_phases = get_moon_phases(2026)
+    moon_phases = moon_phases_2026
 
     # Both phase types present with ~12-13 each
     assert 12 <= len(moon_phases["newmoon"]) <= 14
@@ -35,9 +43,9 @@ def test_moon_phases_2026():
     assert datetime.date(2026, 1, 3) in moon_phases["fullmoon"]
 
 
-def test_moon_phases_roughly_monthly():
+def test_moon_phases_roughly_monthly(moon_phases_2026):
     """Test that moon phases occur roughly once per month."""
-    moon_phases = get_moon_phases(2026)
+    moon_phases = moon_phases_2026
 
     # New moons should be roughly 29-30 days apart
     new_moons = sorted(moon_phases["newmoon"])
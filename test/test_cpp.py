@@ -4,7 +4,12 @@ from pathlib import Path
 
 import pytest
 
-from pylendar.pylendar import SimpleCPP, join_continuation_lines, remove_comments
+from pylendar.pylendar import (
+    SimpleCPP,
+    join_continuation_lines,
+    remove_comments,
+    split_event_lines,
+)
 
 
 def test_simplecpp_can_resolve_includes(tmp_path):
@@ -27,12 +32,19 @@ def test_simplecpp_can_resolve_includes(tmp_path):
     assert "07/04\tIndependence Day" in result
 
 
+def test_process_text_resolves_includes_from_origin(tmp_path: Path) -> None:
+    """In-memory text resolves relative includes from its origin's directory."""
+    (tmp_path / "holidays").write_text("01/01\tNew Year's Day\n")
+    cpp = SimpleCPP(include_dirs=[])
+    text = '#include "holidays" /* local */\n07/04\tIndependence Day\n'
+    result = cpp.process_text(text, origin=tmp_path / "calendar")
+    assert result == ["01/01\tNew Year's Day", "07/04\tIndependence Day"]
+
+
 def test_include_not_found_skips(tmp_path: Path) -> None:
     """Missing include file is silently skipped (with a log warning)."""
-    cal = tmp_path / "calendar"
-    cal.write_text('#include "nonexistent.file"\n01/01\tNew Year\n')
     cpp = SimpleCPP(include_dirs=[tmp_path])
-    result = cpp.process_file(cal)
+    result = cpp.process_text('#include "nonexistent.file"\n01/01\tNew Year\n')
     assert result == ["01/01\tNew Year"]
 
 
@@ -126,14 +138,12 @@ def test_process_file_skips_non_utf8(tmp_path: Path) -> None:
 
 def test_malformed_include_raises(tmp_path: Path) -> None:
     """Bare #include with no filename raises SyntaxError."""
-    cal = tmp_path / "calendar"
-    cal.write_text("#include\n")
     cpp = SimpleCPP(include_dirs=[tmp_path])
     with pytest.raises(
         SyntaxError,
-        match=r"Malformed include directive in .*:1: #include",
+        match=r"Malformed include directive in .*calendar:1: #include",
     ):
-        cpp.process_file(cal)
+        cpp.process_text("#include\n", origin=tmp_path / "calendar")
 
 
 # --- helper functions ---
@@ -153,6 +163,35 @@ def test_remove_comments_keeps_url_text() -> None:
     assert result == text
 
 
+def test_remove_comments_leading_line_comment() -> None:
+    """A // comment at the very start of the text is cut up to its newline."""
+    assert remove_comments("// header\n01/01\tEvent\n") == "\n01/01\tEvent\n"
+    assert remove_comments("// only a comment") == ""
+
+
+_LONG_BODY = "01/01\tEvent\n" * 40_000
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        pytest.param(
+            "02/02\tFirst\n/* never closed\n" + _LONG_BODY,
+            "02/02\tFirst\n/* never closed\n" + _LONG_BODY,
+            id="unterminated",
+        ),
+        pytest.param(
+            "/*\n" + _LONG_BODY + "*/\n03/03\tAfter\n",
+            "\n03/03\tAfter\n",
+            id="commented-out-block",
+        ),
+    ],
+)
+def test_remove_comments_long_block_comment(text: str, expected: str) -> None:
+    """A block comment spanning 40,000 lines is handled in one linear pass."""
+    assert remove_comments(text) == expected
+
+
 def test_join_continuation_lines_joins_tab_prefixed_lines() -> None:
     """Tab-prefixed continuation lines are attached to prior event lines."""
     lines = ["07/04\tEvent", "\tcontinued", "08/01\tOther"]
@@ -165,3 +204,10 @@ def test_join_continuation_lines_keeps_orphan_tab_line() -> None:
     lines = ["\torphan", "07/04\tEvent"]
     result = join_continuation_lines(lines)
     assert result == ["\torphan", "07/04\tEvent"]
+
+
+def test_split_event_lines_separates_tabbed_lines() -> None:
+    """Tabbed lines are events; the rest are assignments and directives."""
+    lines = ["LANG=C", "07/04\tEvent", "Easter=Pasen", "08/01\tOther"]
+    result = split_event_lines(lines)
+    assert result == (["07/04\tEvent", "08/01\tOther"], ["LANG=C", "Easter=Pasen"])
@@ -142,27 +142,28 @@ Jun\tAlso June 1st (abbreviation)
 # --- weekday and ordinal formats ---
 
 
-def test_nth_weekday_of_month(run_calendar):
-    """Test Nth weekday of month expressions (e.g., May Sun+2 for Mother's Day)."""
-    calendar_content = """\
+_NTH_WEEKDAY_CALENDAR = """\
 May Sun+2\tMother's Day
 Sep Mon+1\tLabor Day
 Nov Thu+4\tThanksgiving
 """
-    # Mother's Day 2026: May 10 (2nd Sunday)
-    today = datetime.date(2026, 5, 10)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["May 10*\tMother's Day"]
 
-    # Labor Day 2026: Sep 7 (1st Monday)
-    today = datetime.date(2026, 9, 7)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Sep  7*\tLabor Day"]
 
-    # Thanksgiving 2026: Nov 26 (4th Thursday)
-    today = datetime.date(2026, 11, 26)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Nov 26*\tThanksgiving"]
+@pytest.mark.parametrize(
+    ("today", "expected"),
+    [
+        # Mother's Day 2026: May 10 (2nd Sunday)
+        (datetime.date(2026, 5, 10), ["May 10*\tMother's Day"]),
+        # Labor Day 2026: Sep 7 (1st Monday)
+        (datetime.date(2026, 9, 7), ["Sep  7*\tLabor Day"]),
+        # Thanksgiving 2026: Nov 26 (4th Thursday)
+        (datetime.date(2026, 11, 26), ["Nov 26*\tThanksgiving"]),
+    ],
+    ids=["mothers-day", "labor-day", "thanksgiving"],
+)
+def test_nth_weekday_of_month(run_calendar, today, expected):
+    """Test Nth weekday of month expressions (e.g., May Sun+2 for Mother's Day)."""
+    assert run_calendar(_NTH_WEEKDAY_CALENDAR, today, ahead=0) == expected
 
 
 def test_last_weekday_of_month(run_calendar):
@@ -214,33 +215,31 @@ Friday\tTGIF!
     assert result == []
 
 
-def test_ordinal_weekday_numeric_month(run_calendar):
-    """Test MM/WkdayOrdinal format (e.g., 10/MonSecond for Thanksgiving Canada)."""
-    calendar_content = """\
+_MM_WKDAY_ORD_CALENDAR = """\
 10/MonSecond\tThanksgiving Day in Canada
 12/SunFirst\tFirst Sunday of Advent
 01/MonThird\tMartin Luther King Day
 05/MonLast\tMemorial Day
 """
-    # 2nd Monday of October 2026: Oct 12
-    today = datetime.date(2026, 10, 12)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Oct 12*\tThanksgiving Day in Canada"]
-
-    # 1st Sunday of December 2026: Dec 6
-    today = datetime.date(2026, 12, 6)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Dec  6*\tFirst Sunday of Advent"]
 
-    # 3rd Monday of January 2026: Jan 19
-    today = datetime.date(2026, 1, 19)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Jan 19*\tMartin Luther King Day"]
 
-    # Last Monday of May 2026: May 25
-    today = datetime.date(2026, 5, 25)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["May 25*\tMemorial Day"]
+@pytest.mark.parametrize(
+    ("today", "expected"),
+    [
+        # 2nd Monday of October 2026: Oct 12
+        (datetime.date(2026, 10, 12), ["Oct 12*\tThanksgiving Day in Canada"]),
+        # 1st Sunday of December 2026: Dec 6
+        (datetime.date(2026, 12, 6), ["Dec  6*\tFirst Sunday of Advent"]),
+        # 3rd Monday of January 2026: Jan 19
+        (datetime.date(2026, 1, 19), ["Jan 19*\tMartin Luther King Day"]),
+        # Last Monday of May 2026: May 25
+        (datetime.date(2026, 5, 25), ["May 25*\tMemorial Day"]),
+    ],
+    ids=["second", "first", "third", "last"],
+)
+def test_ordinal_weekday_numeric_month(run_calendar, today, expected):
+    """Test MM/WkdayOrdinal format (e.g., 10/MonSecond for Thanksgiving Canada)."""
+    assert run_calendar(_MM_WKDAY_ORD_CALENDAR, today, ahead=0) == expected
 
 
 def test_ordinal_weekday_named_month_with_offset(run_calendar):
@@ -254,50 +253,52 @@ Oct/SatFourth-2\tHobart Show Day (TAS)
     assert result == ["Oct 22*\tHobart Show Day (TAS)"]
 
 
-def test_mm_wkday_offset_format(run_calendar):
-    """Test MM/Weekday+/-N format (e.g., 03/Sun-1, 11/Wed+3, 12/Sun+1)."""
-    calendar_content = """\
+_MM_WKDAY_OFFSET_CALENDAR = """\
 03/Sun-1\tLast Sunday of March
 11/Wed+3\tThird Wednesday of November
 12/Sun+1\tFirst Sunday of December
 """
-    # Last Sunday of March 2026: Mar 29
-    today = datetime.date(2026, 3, 29)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Mar 29*\tLast Sunday of March"]
 
-    # 3rd Wednesday of November 2026: Nov 18
-    today = datetime.date(2026, 11, 18)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Nov 18*\tThird Wednesday of November"]
 
-    # 1st Sunday of December 2026: Dec 6
-    today = datetime.date(2026, 12, 6)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Dec  6*\tFirst Sunday of December"]
+@pytest.mark.parametrize(
+    ("today", "expected"),
+    [
+        # Last Sunday of March 2026: Mar 29
+        (datetime.date(2026, 3, 29), ["Mar 29*\tLast Sunday of March"]),
+        # 3rd Wednesday of November 2026: Nov 18
+        (datetime.date(2026, 11, 18), ["Nov 18*\tThird Wednesday of November"]),
+        # 1st Sunday of December 2026: Dec 6
+        (datetime.date(2026, 12, 6), ["Dec  6*\tFirst Sunday of December"]),
+    ],
+    ids=["last", "third", "first"],
+)
+def test_mm_wkday_offset_format(run_calendar, today, expected):
+    """Test MM/Weekday+/-N format (e.g., 03/Sun-1, 11/Wed+3, 12/Sun+1)."""
+    assert run_calendar(_MM_WKDAY_OFFSET_CALENDAR, today, ahead=0) == expected
 
 
-def test_wkday_ord_month_format(run_calendar):
-    """Test WkdayOrd Month format (e.g., SunFirst Aug, SunThird Jul)."""
-    calendar_content = """\
+_WKDAY_ORD_MONTH_CALENDAR = """\
 SunFirst Aug\tFirst Sunday of August
 SunThird Jul\tThird Sunday of July
 SunLast Jun\tLast Sunday of June
 """
-    # First Sunday of August 2026: Aug 2
-    today = datetime.date(2026, 8, 2)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Aug  2*\tFirst Sunday of August"]
 
-    # Third Sunday of July 2026: Jul 19
-    today = datetime.date(2026, 7, 19)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Jul 19*\tThird Sunday of July"]
 
-    # Last Sunday of June 2026: Jun 28
-    today = datetime.date(2026, 6, 28)
-    result = run_calendar(calendar_content, today, ahead=0)
-    assert result == ["Jun 28*\tLast Sunday of June"]
+@pytest.mark.parametrize(
+    ("today", "expected"),
+    [
+        # First Sunday of August 2026: Aug 2
+        (datetime.date(2026, 8, 2), ["Aug  2*\tFirst Sunday of August"]),
+        # Third Sunday of July 2026: Jul 19
+        (datetime.date(2026, 7, 19), ["Jul 19*\tThird Sunday of July"]),
+        # Last Sunday of June 2026: Jun 28
+        (datetime.date(2026, 6, 28), ["Jun 28*\tLast Sunday of June"]),
+    ],
+    ids=["first", "third", "last"],
+)
+def test_wkday_ord_month_format(run_calendar, today, expected):
+    """Test WkdayOrd Month format (e.g., SunFirst Aug, SunThird Jul)."""
+    assert run_calendar(_WKDAY_ORD_MONTH_CALENDAR, today, ahead=0) == expected
 
 
 # --- wildcards ---
@@ -5,7 +5,9 @@ and CLI invocation. Per-format output tests live in test_date_formats_e2e.py.
 """
 
 import datetime
+import io
 import logging
+import sys
 
 import pytest
 
@@ -190,6 +192,28 @@ def test_cli_smoke(tmp_path, capsys):
     assert "Jan 16\tAnother event" in output
 
 
+def test_cli_reads_calendar_from_stdin(monkeypatch, capsys):
+    """-f - reads the calendar from standard input, comments and all."""
+    calendar_text = "/* header */\n01/15\tTest event // note\n01/20\tLater\n"
+    stdin = io.TextIOWrapper(io.BytesIO(calendar_text.encode()))
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    main(["-f", "-", "-t", "20260115"])
+
+    assert capsys.readouterr().out == "Jan 15\tTest event\n"
+
+
+def test_cli_reads_stdin_as_utf8(monkeypatch, capsys):
+    """-f - decodes UTF-8 even when stdin's own encoding is something else."""
+    calendar_text = "01/15\tCafé Müller\n"
+    stdin = io.TextIOWrapper(io.BytesIO(calendar_text.encode()), encoding="latin-1")
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    main(["-f", "-", "-t", "20260115"])
+
+    assert capsys.readouterr().out == "Jan 15\tCafé Müller\n"
+
+
 @pytest.mark.parametrize("flag", ["-v", "-vv"])
 def test_cli_verbose_flags(tmp_path, capsys, caplog, flag):
     """-v and -vv enable info logging without changing event output."""
@@ -313,6 +337,28 @@ def test_get_matching_events_unparseable_date_returns_empty() -> None:
     assert result == []
 
 
+def test_parse_caches_by_normalized_string() -> None:
+    """Equivalent date strings parse once and share the resulting expression."""
+    parser = DateStringParser()
+    first = parser.parse("Friday")
+    assert first is not None
+    assert parser.parse("  FRIDAY ") is first
+    assert parser.parse("nonsense") is None
+    assert parser.parse("nonsense") is None
+
+
+def test_get_matching_events_memo_shares_date_strings() -> None:
+    """A shared memo parses each date string once and keeps descriptions apart."""
+    parser = DateStringParser()
+    dates = {datetime.date(2026, 3, 1), datetime.date(2026, 3, 2)}
+    memo: dict[str, tuple[frozenset[datetime.date], bool]] = {}
+    first = get_matching_events("03/01\tFirst", dates, parser, memo)
+    second = get_matching_events("03/01\tSecond", dates, parser, memo)
+    assert list(memo) == ["03/01"]
+    assert [e.description for e in first + second] == ["First", "Second"]
+    assert {e.date for e in first + second} == {datetime.date(2026, 3, 1)}
+
+
 # --- year-boundary matching ---
 
 
@@ -1,20 +1,24 @@
-"""Tests for LANG= and SEQUENCE= calendar directives."""
+"""Tests for LANG=/SEQUENCE= directives and non-astronomical special dates."""
 
+import argparse
 import datetime
 import locale
 import logging
 import sys
+from collections.abc import Iterator
 
-import dateutil.easter
 import pytest
 
 from pylendar.pylendar import (
+    BuiltinSpecial,
     CalendarDirectives,
     DateStringParser,
     FixedDate,
     NthWeekdayOfMonth,
+    _environment_lc_time,
     extract_directives,
     parse_special_dates,
+    resolve_today,
 )
 
 # ---------------------------------------------------------------------------
@@ -126,6 +130,14 @@ def german_locale() -> str:
     return ""  # unreachable, keeps type checker happy
 
 
+@pytest.fixture
+def fresh_environment_locale() -> Iterator[None]:
+    """Forget the cached environment locale around a test that sets it."""
+    _environment_lc_time.cache_clear()
+    yield
+    _environment_lc_time.cache_clear()
+
+
 @pytest.mark.parametrize("lang", ["C", "POSIX", "UTF-8"])
 def test_noop_lang_values(lang: str) -> None:
     """LANG=C/POSIX/UTF-8 does not change the parser's month map."""
@@ -167,6 +179,7 @@ def test_english_still_works_with_locale(german_locale: str) -> None:
     sys.platform == "win32",
     reason="Windows setlocale() uses the system locale, not environment variables",
 )
+@pytest.mark.usefixtures("fresh_environment_locale")
 def test_environment_locale_names_recognized(
     german_locale: str, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -182,6 +195,7 @@ def test_environment_locale_names_recognized(
     assert parser.parse("17 dezember") == FixedDate(month=12, day=17)
 
 
+@pytest.mark.usefixtures("fresh_environment_locale")
 def test_invalid_environment_locale_falls_back(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -299,10 +313,8 @@ def test_conflicting_builtin_alias_warns_and_keeps_originals(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Conflicting known roots warn instead of rebinding a built-in name."""
-    catholic_easter = dateutil.easter.easter(2026)
-    orthodox_easter = dateutil.easter.easter(
-        2026, method=dateutil.easter.EASTER_ORTHODOX
-    )
+    catholic_easter = datetime.date(2026, 4, 5)
+    orthodox_easter = datetime.date(2026, 4, 12)
 
     with caplog.at_level(logging.WARNING, logger="pylendar"):
         date_exprs = parse_special_dates(["Easter=Paskha"])
@@ -371,6 +383,50 @@ def test_ordinal_date_with_four_digit_offset_returns_none() -> None:
     assert parser.parse("Oct/SatFourth+1000") is None
 
 
+# ---------------------------------------------------------------------------
+# Non-astronomical special dates: Easter and ChineseNewYear (1900-2099 table)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("year", "easter", "paskha"),
+    [
+        (1913, datetime.date(1913, 3, 23), datetime.date(1913, 4, 27)),
+        (1943, datetime.date(1943, 4, 25), datetime.date(1943, 4, 25)),
+        (2024, datetime.date(2024, 3, 31), datetime.date(2024, 5, 5)),
+        (2025, datetime.date(2025, 4, 20), datetime.date(2025, 4, 20)),
+        (2026, datetime.date(2026, 4, 5), datetime.date(2026, 4, 12)),
+        (2038, datetime.date(2038, 4, 25), datetime.date(2038, 4, 25)),
+    ],
+)
+def test_easter_dates(year: int, easter: datetime.date, paskha: datetime.date) -> None:
+    """Western and Orthodox Easter match known dates, including the extremes."""
+    assert BuiltinSpecial("easter").resolve(year) == {easter}
+    assert BuiltinSpecial("paskha").resolve(year) == {paskha}
+
+
+@pytest.mark.parametrize(
+    ("year", "expected"),
+    [
+        (1900, {datetime.date(1900, 1, 31)}),
+        (2026, {datetime.date(2026, 2, 17)}),
+        (2099, {datetime.date(2099, 1, 21)}),
+        (1899, set()),
+        (2100, set()),
+    ],
+)
+def test_chinese_new_year(year: int, expected: set[datetime.date]) -> None:
+    """ChineseNewYear matches its table at both ends and is empty outside it."""
+    assert BuiltinSpecial("chinesenewyear").resolve(year) == expected
+
+
+@pytest.mark.parametrize("year", [1899, 2100])
+def test_chinese_new_year_out_of_range_rejected(year: int) -> None:
+    """-t ChineseNewYear is rejected in a year the table does not cover."""
+    with pytest.raises(argparse.ArgumentTypeError, match="does not resolve"):
+        resolve_today("ChineseNewYear", today=datetime.date(year, 6, 1))
+
+
 # ---------------------------------------------------------------------------
 # Integration: both directives together (end-to-end via process_calendar)
 # ---------------------------------------------------------------------------
@@ -445,7 +501,7 @@ def test_non_ascii_alias_with_offset() -> None:
     parser = DateStringParser(date_exprs=date_exprs)
     result = parser.parse("Påsk-47")
     assert result is not None
-    easter = dateutil.easter.easter(2026)
+    easter = datetime.date(2026, 4, 5)
     assert easter - datetime.timedelta(days=47) in result.resolve(2026)
 
 
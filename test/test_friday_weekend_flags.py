@@ -1,6 +1,9 @@
 """Tests for the -F (friday), -A (business-day), and -W (calendar-day) flags."""
 
+import calendar
 import datetime
+import io
+import sys
 from pathlib import Path
 
 import pytest
@@ -102,14 +105,13 @@ def test_w_flag_on_non_friday(run_calendar):
 # --- -A flag tests (business-day counting with weekend expansion) ---
 
 
+# Two weeks starting on Monday, March 2, 2026
+_A_DAYS = tuple(
+    datetime.date(2026, 3, 2) + datetime.timedelta(days=i) for i in range(14)
+)
+
 _A_CALENDAR = (
-    "\n".join(
-        f"{d.strftime('%m/%d')}\t{d.strftime('%A')}"
-        for d in (
-            datetime.date(2026, 3, 2) + datetime.timedelta(days=i) for i in range(14)
-        )
-    )
-    + "\n"
+    "\n".join(f"{d.strftime('%m/%d')}\t{d.strftime('%A')}" for d in _A_DAYS) + "\n"
 )
 
 
@@ -142,6 +144,17 @@ def test_a_flag_business_day_expansion(run_calendar, today, ahead, expected_days
     assert result[0].startswith(today.strftime("%b"))
 
 
+@pytest.mark.parametrize(
+    ("today", "expected_days"),
+    [(day, 4 if day.weekday() == calendar.FRIDAY else 2) for day in _A_DAYS[:7]],
+    ids=["mon", "tue", "wed", "thu", "fri", "sat", "sun"],
+)
+def test_default_ahead_per_weekday(run_calendar, today, expected_days):
+    """Without -A/-W, Friday looks 3 days ahead and every other day 1."""
+    result = run_calendar(_A_CALENDAR, today)
+    assert len(result) == expected_days
+
+
 def test_a_flag_mon_a5_exact_range(run_calendar):
     """Verify Mon -A 5 includes exactly Mar 2-9 (8 days)."""
     monday = datetime.date(2026, 3, 2)
@@ -161,23 +174,43 @@ def test_a_flag_mon_a5_exact_range(run_calendar):
 # --- CLI integration tests ---
 
 
-def test_cli_f_flag(tmp_path, capsys):
-    """Smoke test: -F 4 (BSD Thursday) makes Thursday trigger 3-day look-ahead."""
-    calendar_file = tmp_path / "calendar"
-    calendar_file.write_text(
-        "07/09\tThursday event\n07/10\tFriday event\n"
-        "07/11\tSaturday event\n07/12\tSunday event\n"
-    )
+@pytest.mark.parametrize(
+    ("argv", "calendar_text", "expected"),
+    [
+        pytest.param(
+            # July 9, 2026 is a Thursday; BSD 4 = Thursday -> Python weekday 3,
+            # so Thursday as "Friday" triggers the 3-day look-ahead.
+            ["-F", "4", "-t", "20260709"],
+            "07/09\tThursday event\n07/10\tFriday event\n"
+            "07/11\tSaturday event\n07/12\tSunday event\n",
+            [
+                "Jul  9\tThursday event",
+                "Jul 10\tFriday event",
+                "Jul 11\tSaturday event",
+                "Jul 12\tSunday event",
+            ],
+            id="F-thursday",
+        ),
+        pytest.param(
+            # -W 5 on a Friday gives exactly 5 days forward.
+            ["-W", "5", "-t", "20260710"],
+            "07/10\tFriday\n07/11\tSaturday\n07/12\tSunday\n"
+            "07/13\tMonday\n07/14\tTuesday\n07/15\tWednesday\n",
+            ["Jul 10\tFriday", "Jul 15\tWednesday"],
+            id="W-friday",
+        ),
+    ],
+)
+def test_cli_day_window_smoke(monkeypatch, capsys, argv, calendar_text, expected):
+    """Smoke test: -F and -W reach the day window through the CLI."""
+    stdin = io.TextIOWrapper(io.BytesIO(calendar_text.encode()))
+    monkeypatch.setattr(sys, "stdin", stdin)
 
-    # July 9, 2026 is a Thursday; BSD 4 = Thursday -> Python weekday 3
-    main(["-F", "4", "-f", str(calendar_file), "-t", "20260709"])
+    main([*argv, "-f", "-"])
 
     output = capsys.readouterr().out
-    # Thursday as "Friday" triggers the 3-day look-ahead
-    assert "Jul  9\tThursday event" in output
-    assert "Jul 10\tFriday event" in output
-    assert "Jul 11\tSaturday event" in output
-    assert "Jul 12\tSunday event" in output
+    for line in expected:
+        assert line in output
 
 
 def test_cli_a_flag_on_friday(tmp_path, capsys):
@@ -199,21 +232,6 @@ def test_cli_a_flag_on_friday(tmp_path, capsys):
     assert "Wednesday" not in output
 
 
-def test_cli_w_flag(tmp_path, capsys):
-    """Smoke test: -W 5 on a Friday gives exactly 5 days forward."""
-    calendar_file = tmp_path / "calendar"
-    calendar_file.write_text(
-        "07/10\tFriday\n07/11\tSaturday\n07/12\tSunday\n"
-        "07/13\tMonday\n07/14\tTuesday\n07/15\tWednesday\n"
-    )
-
-    main(["-W", "5", "-f", str(calendar_file), "-t", "20260710"])
-
-    output = capsys.readouterr().out
-    assert "Jul 10\tFriday" in output
-    assert "Jul 15\tWednesday" in output
-
-
 @pytest.mark.parametrize("f_value", ["0", "6"])
 def test_cli_f_flag_accepts_bsd_bounds(
     tmp_path: Path,
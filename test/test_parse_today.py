@@ -3,12 +3,12 @@
 import calendar
 import datetime
 
-import dateutil.easter
 import pytest
 
 from pylendar.pylendar import main, resolve_today
 
-_TODAY = datetime.date.today()
+# A fixed reference date keeps partial-date expectations stable across years.
+_TODAY = datetime.date(2026, 6, 15)
 
 # --- OpenBSD/Debian positional format (regression tests) ---
 
@@ -36,7 +36,7 @@ _TODAY = datetime.date.today()
 )
 def test_positional_formats(arg: str, expected: datetime.date) -> None:
     """Parse positional date formats (DD, MMDD, YYMMDD, CCYYMMDD)."""
-    assert resolve_today(arg) == expected
+    assert resolve_today(arg, today=_TODAY) == expected
 
 
 # --- ISO 8601 format ---
@@ -49,12 +49,9 @@ def test_positional_formats(arg: str, expected: datetime.date) -> None:
         ("1999-12-31", datetime.date(1999, 12, 31)),
         ("May 15", datetime.date(_TODAY.year, 5, 15)),
         ("15 May", datetime.date(_TODAY.year, 5, 15)),
-        ("easter", dateutil.easter.easter(_TODAY.year)),
-        ("Easter", dateutil.easter.easter(_TODAY.year)),
-        (
-            "paskha",
-            dateutil.easter.easter(_TODAY.year, method=dateutil.easter.EASTER_ORTHODOX),
-        ),
+        ("easter", datetime.date(2026, 4, 5)),
+        ("Easter", datetime.date(2026, 4, 5)),
+        ("paskha", datetime.date(2026, 4, 12)),
     ],
     ids=[
         "typical",
@@ -68,7 +65,7 @@ def test_positional_formats(arg: str, expected: datetime.date) -> None:
 )
 def test_iso_formats(arg: str, expected: datetime.date) -> None:
     """Parse ISO and single-date parser expressions in -t."""
-    assert resolve_today(arg) == expected
+    assert resolve_today(arg, today=_TODAY) == expected
 
 
 def test_weekday_relative_expression() -> None:
@@ -77,7 +74,7 @@ def test_weekday_relative_expression() -> None:
     candidate = anchor + datetime.timedelta(days=1)
     while candidate.weekday() != calendar.SATURDAY:
         candidate += datetime.timedelta(days=1)
-    assert resolve_today("Sat>Jun 19") == candidate
+    assert resolve_today("Sat>Jun 19", today=_TODAY) == candidate
 
 
 # --- macOS/FreeBSD dot-separated format ---
@@ -104,7 +101,28 @@ def test_weekday_relative_expression() -> None:
 )
 def test_dot_formats(arg: str, expected: datetime.date) -> None:
     """Parse dot-separated date formats (dd.mm, dd.mm.year)."""
-    assert resolve_today(arg) == expected
+    assert resolve_today(arg, today=_TODAY) == expected
+
+
+# --- Explicit reference date ---
+
+
+@pytest.mark.parametrize(
+    ("arg", "expected"),
+    [
+        (None, datetime.date(2031, 8, 20)),
+        ("15", datetime.date(2031, 8, 15)),
+        ("0704", datetime.date(2031, 7, 4)),
+        ("16.02", datetime.date(2031, 2, 16)),
+        ("May 15", datetime.date(2031, 5, 15)),
+    ],
+    ids=["unset", "dd", "mmdd", "dd-mm", "month-day"],
+)
+def test_partial_dates_use_given_today(
+    arg: str | None, expected: datetime.date
+) -> None:
+    """Partial dates are completed from the today argument, not the clock."""
+    assert resolve_today(arg, today=datetime.date(2031, 8, 20)) == expected
 
 
 # --- Error cases ---
@@ -146,7 +164,7 @@ def test_dot_formats(arg: str, expected: datetime.date) -> None:
 def test_invalid_inputs(arg: str, match: str) -> None:
     """Reject malformed date strings with appropriate error messages."""
     with pytest.raises(Exception, match=match):
-        resolve_today(arg)
+        resolve_today(arg, today=_TODAY)
 
 
 # --- CLI integration ---
@@ -1,6 +1,8 @@
 """Tests for the -w (weekday) flag."""
 
 import datetime
+import io
+import sys
 
 from pylendar.pylendar import Event, format_event, main
 
@@ -80,12 +82,13 @@ def test_weekday_flag_multiline(run_calendar):
     ]
 
 
-def test_cli_weekday_flag(tmp_path, capsys):
+def test_cli_weekday_flag(monkeypatch, capsys):
     """Smoke test: invoke the CLI with -w and verify weekday names appear."""
-    calendar_file = tmp_path / "calendar"
-    calendar_file.write_text("01/15\tTest event\n01/16\tAnother event\n")
+    calendar_text = "01/15\tTest event\n01/16\tAnother event\n"
+    stdin = io.TextIOWrapper(io.BytesIO(calendar_text.encode()))
+    monkeypatch.setattr(sys, "stdin", stdin)
 
-    main(["-w", "-f", str(calendar_file), "-t", "20260115"])
+    main(["-w", "-f", "-", "-t", "20260115"])
 
     output = capsys.readouterr().out
     # Jan 15, 2026 is a Thursday; Jan 16 is a Friday
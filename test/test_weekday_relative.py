@@ -257,7 +257,9 @@ def test_matches_consistent_with_resolve_for_non_crossing_exprs() -> None:
     exprs = [
         FixedDate(7, 4),
         FixedDate(2, 29, year=2028),
+        FixedDate(2, 30),
         WildcardDay(15),
+        WildcardDay(31),
         EveryDay(),
         EveryDayOfMonth(6),
         NthWeekdayOfMonth(5, 6, 2),
@@ -1,6 +1,7 @@
 import datetime
 
 class Time:
+    ut: float
     @staticmethod
     def Make(
         year: int, month: int, day: int, hour: int, minute: int, second: float